@@ -0,0 +1,398 @@
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+SUITES = ("todo", "weather", "calculator")
+# Fewest samples per side for which mann_whitney_p can drop below alpha=0.01
+MIN_SAMPLES = 5
+
+def measure(func: Callable, repeat: int, teardown: Optional[Callable] = None) -> List[float]:
+    """Run func repeat times and return each duration in seconds.
+
+    teardown, if given, is called with func's return value after each run, outside the timing.
+    """
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+        if teardown is not None:
+            teardown(result)
+    return samples
+
+def summarize(samples: List[float]) -> Dict:
+    return {
+        "samples": samples,
+        "mean": statistics.fmean(samples),
+        "median": statistics.median(samples),
+        "stdev": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "min": min(samples),
+    }
+
+@contextlib.contextmanager
+def quiet():
+    """Swallow the apps' console output while they are being timed"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+# ---------------------------------------------------------------- todo_app
+
+def make_todos(count: int) -> List[Dict]:
+    return [{
+        "id": i + 1,
+        "task": f"Benchmark task #{i}",
+        "completed": i % 3 == 0,
+        "priority": ("high", "normal", "low")[i % 3],
+        "created_at": "2026-01-01 09:00:00",
+        "completed_at": "2026-01-02 17:30:00" if i % 3 == 0 else None,
+    } for i in range(count)]
+
+def bench_todo(sizes: List[int], repeat: int) -> Dict[str, List[float]]:
+    from todo_app import TodoApp
+
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="bench_todo_")
+    try:
+        for size in sizes:
+            path = os.path.join(workdir, f"todos_{size}.json")
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(make_todos(size), f, ensure_ascii=False, indent=2)
+            # Each mutation rewrites the whole file, so keep the slowest sizes short,
+            # but never below the sample count compare() needs to reach significance
+            runs = repeat if size <= 100_000 else max(MIN_SAMPLES, repeat // 2)
+
+            results[f"todo.load[n={size}]"] = measure(lambda: TodoApp(path, background=False), runs)
+
+            def first_page():
+                app = TodoApp(path)
+                app.first_page(filter_status="pending")
+                return app
+            # Let each background loader finish so it cannot slow down the next sample
+            results[f"todo.first_page[n={size}]"] = measure(
+                first_page, runs, teardown=lambda app: app.wait_until_loaded())
+
+            app = TodoApp(path, background=False)
+            results[f"todo.get_stats[n={size}]"] = measure(app.get_stats, runs)
+            results[f"todo.add[n={size}]"] = measure(lambda: app.add_todo("Benchmark add", "high"), runs)
+            results[f"todo.complete[n={size}]"] = measure(lambda: app.complete_todo(size), runs)
+            targets = iter(range(size // 2, size))
+            results[f"todo.delete[n={size}]"] = measure(lambda: app.delete_todo(next(targets)), runs)
+            os.remove(path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+# ---------------------------------------------------------------- weatherapp
+
+class MockWeatherHandler(BaseHTTPRequestHandler):
+    """Minimal OpenWeatherMap stand-in; latency is injected per request"""
+    latency = 0.0
+    counter = 0
+
+    def do_GET(self):
+        time.sleep(self.latency)
+        MockWeatherHandler.counter += 1
+        if self.path.startswith("/data/2.5/weather"):
+            body = mock_current_weather(MockWeatherHandler.counter)
+        elif self.path.startswith("/data/2.5/forecast"):
+            body = mock_forecast()
+        else:
+            self.send_error(404)
+            return
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+def mock_current_weather(sequence: int = 0) -> Dict:
+    # A fresh "dt" per request so every fetch is stored in the history
+    return {
+        "cod": 200,
+        "name": "Benchmark City",
+        "dt": 1_760_000_000 + sequence * 600,
+        "sys": {"country": "BC", "sunrise": 1_760_000_000, "sunset": 1_760_040_000},
+        "main": {"temp": 18.4, "feels_like": 17.9, "humidity": 64, "pressure": 1014},
+        "weather": [{"id": 803, "description": "broken clouds", "icon": "04d"}],
+        "wind": {"speed": 4.2},
+        "visibility": 10000,
+    }
+
+def mock_forecast() -> Dict:
+    items = []
+    for i in range(40):
+        ts = 1_760_000_000 + i * 10_800
+        items.append({
+            "dt": ts,
+            "dt_txt": datetime.fromtimestamp(ts, timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+            "main": {"temp": 10 + i % 8, "humidity": 50 + i % 30},
+            "weather": [{"description": ("light rain", "clear sky")[i % 2], "icon": ("10d", "01d")[i % 2]}],
+        })
+    return {"cod": "200", "city": {"name": "Benchmark City", "country": "BC"}, "list": items}
+
+def bench_weather(repeat: int, latency: float) -> Dict[str, List[float]]:
+    from weatherapp import WeatherApp, WeatherHistory
+
+    MockWeatherHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockWeatherHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}/data/2.5"
+    workdir = tempfile.mkdtemp(prefix="bench_weather_")
+
+    results = {}
+    try:
+        app = WeatherApp()
+        app.base_url = f"{base}/weather"
+        app.forecast_url = f"{base}/forecast"
+        app.history = WeatherHistory(os.path.join(workdir, "weather_history"))
+
+        runs = repeat * 4
+        label = f"latency={latency * 1000:.0f}ms"
+        with quiet():
+            results[f"weather.fetch_current[{label}]"] = measure(lambda: app.get_current_weather("Benchmark City"), runs)
+            results[f"weather.fetch_forecast[{label}]"] = measure(lambda: app.get_forecast("Benchmark City"), runs)
+            current, forecast = mock_current_weather(), mock_forecast()
+            results["weather.parse_current"] = measure(lambda: app.display_current_weather(current), runs)
+            results["weather.forecast_aggregation"] = measure(lambda: app.display_forecast(forecast), runs)
+        results["weather.history_rollup"] = measure(
+            lambda: app.history.rollup("Benchmark City", 0, 2 ** 32 - 1, "hour"), runs)
+    finally:
+        server.shutdown()
+        server.server_close()
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+# ---------------------------------------------------------------- python_calculator
+
+class HeadlessVar:
+    """Stands in for tk.StringVar"""
+    def __init__(self, value: str = ""):
+        self.value = value
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+class HeadlessLabel:
+    """Stands in for the info tk.Label"""
+    def config(self, **kwargs):
+        pass
+
+def headless_calculator():
+    """A Calculator whose logic runs without creating a Tk window"""
+    from python_calculator import Calculator
+
+    calc = Calculator.__new__(Calculator)
+    calc.current, calc.previous, calc.operator = "", "", ""
+    calc.result_shown = False
+    calc.history = []
+    calc.display_var = HeadlessVar("0")
+    calc.info_label = HeadlessLabel()
+    # Keep history in memory only
+    calc.save_history = lambda: None
+    return calc
+
+def bench_calculator(repeat: int) -> Dict[str, List[float]]:
+    calc = headless_calculator()
+    calls = 2_000
+
+    def arithmetic():
+        for i in range(calls):
+            calc.clear()
+            for digit in str(1234 + i):
+                calc.add_digit(digit)
+            calc.set_operator("*+-/"[i % 4])
+            calc.add_digit("7")
+            calc.add_decimal()
+            calc.add_digit("5")
+            calc.calculate()
+
+    results = {f"calculator.arithmetic[x{calls}]": measure(arithmetic, repeat)}
+
+    for name in ("square_root", "square", "reciprocal", "sin", "cos", "tan", "log", "ln"):
+        func = getattr(calc, name, None)
+        if func is None:
+            continue
+
+        def scientific(func=func):
+            for i in range(calls):
+                calc.current = str(1 + i % 89)
+                calc.result_shown = False
+                func()
+        results[f"calculator.{name}[x{calls}]"] = measure(scientific, repeat)
+    return results
+
+# ---------------------------------------------------------------- run / compare
+
+def run_suites(suites: List[str], sizes: List[int], repeat: int, latency: float) -> Dict:
+    benchmarks = {}
+    failed_suites = {}
+    runners = {
+        "todo": lambda: bench_todo(sizes, repeat),
+        "weather": lambda: bench_weather(repeat, latency),
+        "calculator": lambda: bench_calculator(repeat),
+    }
+    for suite in suites:
+        print(f"⏱️  Running {suite} benchmarks...", file=sys.stderr)
+        try:
+            samples = runners[suite]()
+        except Exception as e:
+            # Keep running the other suites, but record the failure so run exits non-zero
+            failed_suites[suite] = f"{type(e).__name__}: {e}"
+            print(f"❌ {suite} failed: {failed_suites[suite]}", file=sys.stderr)
+            continue
+        for name, values in samples.items():
+            benchmarks[name] = summarize(values)
+    return {
+        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": benchmarks,
+        "failed_suites": failed_suites,
+    }
+
+def mann_whitney_p(baseline: List[float], current: List[float]) -> float:
+    """One-sided p-value that current is slower than baseline (Mann-Whitney U, normal approximation)"""
+    n1, n2 = len(baseline), len(current)
+    if n1 < 2 or n2 < 2:
+        return 1.0
+    combined = sorted([(v, 0) for v in baseline] + [(v, 1) for v in current])
+    ranks = [0.0] * len(combined)
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        i = j + 1
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+    mean = n1 * n2 / 2
+    sd = (n1 * n2 * (n1 + n2 + 1) / 12) ** 0.5
+    z = (u - mean - 0.5) / sd  # continuity correction
+    return 1 - statistics.NormalDist().cdf(z)
+
+def compare(baseline: Dict, current: Dict, alpha: float = 0.01, threshold: float = 0.10) -> List[Dict]:
+    """Per-benchmark comparison; a regression is both significant and slower by more than threshold.
+
+    Benchmarks in the baseline that the current run did not produce are reported as missing.
+    """
+    rows = []
+    for name, base in baseline["benchmarks"].items():
+        cur = current["benchmarks"].get(name)
+        if cur is None:
+            rows.append({
+                "name": name,
+                "baseline": base["median"],
+                "current": None,
+                "change": None,
+                "p_value": None,
+                "regression": False,
+                "missing": True,
+            })
+            continue
+        change = cur["median"] / base["median"] - 1 if base["median"] > 0 else 0.0
+        p_value = mann_whitney_p(base["samples"], cur["samples"])
+        rows.append({
+            "name": name,
+            "baseline": base["median"],
+            "current": cur["median"],
+            "change": change,
+            "p_value": p_value,
+            "regression": p_value < alpha and change > threshold,
+            "missing": False,
+        })
+    return rows
+
+def format_seconds(value: float) -> str:
+    if value >= 1:
+        return f"{value:.2f} s"
+    if value >= 1e-3:
+        return f"{value * 1e3:.2f} ms"
+    return f"{value * 1e6:.1f} µs"
+
+def print_results(report: Dict):
+    print("\n" + "="*72)
+    print(f"📊 BENCHMARKS ({report['created_at']}, Python {report['python']})")
+    print("="*72)
+    for name, result in report["benchmarks"].items():
+        print(f"{name:<44} median {format_seconds(result['median']):>10}  ±{format_seconds(result['stdev']):>10}")
+    for suite, error in report.get("failed_suites", {}).items():
+        print(f"❌ {suite} suite failed: {error}")
+
+def print_comparison(rows: List[Dict]):
+    print("\n" + "="*80)
+    print("📊 BENCHMARK COMPARISON")
+    print("="*80)
+    for row in rows:
+        if row["missing"]:
+            print(f"❌ {row['name']:<42} {format_seconds(row['baseline']):>10} → {'missing':>10}")
+            continue
+        icon = "❌" if row["regression"] else "✅"
+        print(f"{icon} {row['name']:<42} {format_seconds(row['baseline']):>10} → {format_seconds(row['current']):>10}"
+              f"  {row['change']:+7.1%}  p={row['p_value']:.3f}")
+    regressions = sum(row["regression"] for row in rows)
+    missing = sum(row["missing"] for row in rows)
+    print("-" * 80)
+    print(f"{'❌' if regressions or missing else '✅'} {regressions} significant slowdown(s) "
+          f"and {missing} missing benchmark(s) in {len(rows)} benchmarks")
+
+def load_report(path: str) -> Dict:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks and regression guard for the todo, weather and calculator apps")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run benchmarks and save the results as a JSON baseline")
+    run.add_argument("--suite", action="append", choices=SUITES, help="suite to run (repeatable, default: all)")
+    run.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="todo list sizes")
+    run.add_argument("--repeat", type=int, default=7, help="samples per benchmark")
+    run.add_argument("--latency", type=float, default=0.02, help="mock server latency in seconds")
+    run.add_argument("--output", default="benchmark_results.json")
+
+    cmp = commands.add_parser("compare", help="flag significant slowdowns against a baseline")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--alpha", type=float, default=0.01, help="significance level")
+    cmp.add_argument("--threshold", type=float, default=0.10, help="minimum relative slowdown to report")
+
+    args = parser.parse_args(argv)
+    if args.command == "run" and args.repeat < MIN_SAMPLES:
+        parser.error(f"--repeat must be at least {MIN_SAMPLES} for compare to detect a slowdown")
+
+    if args.command == "run":
+        report = run_suites(args.suite or list(SUITES), args.sizes, args.repeat, args.latency)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print_results(report)
+        print(f"\n💾 Saved to {args.output}")
+        return 1 if report["failed_suites"] else 0
+
+    rows = compare(load_report(args.baseline), load_report(args.current), args.alpha, args.threshold)
+    print_comparison(rows)
+    return 1 if any(row["regression"] or row["missing"] for row in rows) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
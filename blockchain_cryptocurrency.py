@@ -0,0 +1,728 @@
+import hashlib
+import json
+import mmap
+import multiprocessing as mp
+import os
+import shutil
+import struct
+import tempfile
+import time
+from array import array
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Header layout: prefix (fixed while mining) followed by an 8-byte nonce.
+# prev_hash (32) + tx_root (32) + index (8) + timestamp (8) + bits (4) = 84 bytes,
+# so the first 64-byte SHA-256 block is compressed once and reused for every nonce.
+HEADER_PREFIX = struct.Struct("<32s32sQdI")
+NONCE = struct.Struct("<Q")
+MAX_NONCE = 2 ** 32
+CHECK_INTERVAL = 1 << 14  # nonces between checks of the cancel flag
+# Below this many expected hashes (well under a second on one core) a block is
+# mined in-process: handing the search to the pool would cost more than it saves.
+PARALLEL_MIN_HASHES = 1 << 20
+
+# Block file record: length, header prefix, nonce, block hash, then the transactions as JSON.
+RECORD = struct.Struct("<I32s32sQdIQ32s")
+TX_INDEX_ENTRY = struct.Struct("<32sQI")
+
+_cancel_event = None
+
+
+def target_from_bits(bits: int) -> bytes:
+    """Return the 32-byte target a block hash must be below"""
+    if bits <= 0:
+        return b"\xff" * 32
+    if bits >= 256:
+        return b"\x00" * 32
+    return (1 << (256 - bits)).to_bytes(32, "big")
+
+
+def transaction_hash(tx: Dict) -> bytes:
+    """SHA-256 of a transaction's canonical JSON form"""
+    payload = json.dumps(tx, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).digest()
+
+
+def _merkle_levels(hashes: List[bytes]) -> List[List[bytes]]:
+    """All levels of the Merkle tree, leaves first; odd levels repeat their last node"""
+    levels = [list(hashes) or [b"\x00" * 32]]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        if len(level) % 2:
+            level = level + [level[-1]]
+        levels.append([hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)])
+    return levels
+
+
+def merkle_root(hashes: List[bytes]) -> bytes:
+    return _merkle_levels(hashes)[-1][0]
+
+
+def merkle_proof(hashes: List[bytes], position: int) -> List[Tuple[bytes, bool]]:
+    """Sibling path for the leaf at position; the flag is True when the sibling is on the right"""
+    proof = []
+    for level in _merkle_levels(hashes)[:-1]:
+        sibling = position ^ 1
+        proof.append((level[sibling] if sibling < len(level) else level[position], sibling > position))
+        position //= 2
+    return proof
+
+
+def verify_merkle_proof(leaf: bytes, proof: List[Tuple[bytes, bool]], root: bytes) -> bool:
+    node = leaf
+    for sibling, sibling_is_right in proof:
+        node = hashlib.sha256(node + sibling if sibling_is_right else sibling + node).digest()
+    return node == root
+
+
+def _init_worker(event):
+    """Pool initializer: share the cancel flag with every worker"""
+    global _cancel_event
+    _cancel_event = event
+
+
+def _search_nonce(prefix: bytes, target: bytes, start: int, stop: int, step: int) -> Tuple[Optional[int], int]:
+    """Scan nonces start, start+step, ... below stop.
+
+    Returns (nonce or None, hashes computed).
+    """
+    midstate = hashlib.sha256(prefix)
+    pack = NONCE.pack
+    hashes = 0
+    nonce = start
+    while nonce < stop:
+        batch_end = min(stop, nonce + CHECK_INTERVAL * step)
+        for n in range(nonce, batch_end, step):
+            h = midstate.copy()
+            h.update(pack(n))
+            if h.digest() < target:
+                return n, hashes + (n - nonce) // step + 1
+        hashes += len(range(nonce, batch_end, step))
+        nonce = batch_end
+        if _cancel_event is not None and _cancel_event.is_set():
+            break
+    return None, hashes
+
+
+class MinerPool:
+    """Worker processes for nonce searches, started on first use and reused until close()"""
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+        self._pool = None
+        self._event = None
+
+    def start(self):
+        if self._pool is None and self.workers > 1:
+            self._event = mp.Event()
+            self._pool = mp.Pool(self.workers, initializer=_init_worker, initargs=(self._event,))
+
+    def search(self, prefix: bytes, target: bytes, start: int = 0,
+               stop: int = MAX_NONCE) -> Tuple[Optional[int], int]:
+        """Split the nonce range across the workers and stop them all once one succeeds.
+
+        Returns (nonce or None, total hashes computed).
+        """
+        if self.workers <= 1:
+            return _search_nonce(prefix, target, start, stop, 1)
+        self.start()
+        self._event.clear()
+        found = []
+        total = [0]
+
+        def on_result(result):
+            nonce, hashes = result
+            total[0] += hashes
+            if nonce is not None:
+                found.append(nonce)
+                self._event.set()
+
+        jobs = [
+            self._pool.apply_async(_search_nonce, (prefix, target, start + i, stop, self.workers),
+                                   callback=on_result)
+            for i in range(self.workers)
+        ]
+        for job in jobs:
+            job.get()
+        return (min(found) if found else None), total[0]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "MinerPool":
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def search_nonce_parallel(prefix: bytes, target: bytes, workers: int,
+                          start: int = 0, stop: int = MAX_NONCE) -> Tuple[Optional[int], int]:
+    """One-off search on a temporary pool; use a MinerPool to search repeatedly"""
+    with MinerPool(workers) as pool:
+        return pool.search(prefix, target, start, stop)
+
+
+class Block:
+    def __init__(self, index: int, transactions: List[Dict], previous_hash: str,
+                 difficulty: int = 16, timestamp: Optional[float] = None, nonce: int = 0):
+        self.index = index
+        self.transactions = transactions
+        self.previous_hash = previous_hash
+        self.difficulty = difficulty
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.nonce = nonce
+        self.hash = self.calculate_hash()
+
+    def tx_root(self) -> bytes:
+        """Merkle root of the block's transaction hashes"""
+        return merkle_root([transaction_hash(tx) for tx in self.transactions])
+
+    def header_prefix(self) -> bytes:
+        """Header bytes that stay fixed while the nonce changes"""
+        return HEADER_PREFIX.pack(
+            bytes.fromhex(self.previous_hash),
+            self.tx_root(),
+            self.index,
+            self.timestamp,
+            self.difficulty,
+        )
+
+    def calculate_hash(self) -> str:
+        return hashlib.sha256(self.header_prefix() + NONCE.pack(self.nonce)).hexdigest()
+
+    def meets_target(self) -> bool:
+        return bytes.fromhex(self.hash) < target_from_bits(self.difficulty)
+
+    def mine(self, workers: Optional[int] = None, pool: Optional[MinerPool] = None) -> int:
+        """Find a nonce satisfying the difficulty target; returns hashes computed.
+
+        Pass a long-lived pool when mining many blocks so its processes are reused.
+        """
+        if 2 ** self.difficulty < PARALLEL_MIN_HASHES:
+            pool = MinerPool(1)
+        owned = pool is None
+        if owned:
+            pool = MinerPool(workers)
+        target = target_from_bits(self.difficulty)
+        hashes = 0
+        try:
+            while True:
+                nonce, done = pool.search(self.header_prefix(), target)
+                hashes += done
+                if nonce is not None:
+                    self.nonce = nonce
+                    self.hash = self.calculate_hash()
+                    return hashes
+                # Nonce space exhausted: a new timestamp gives a fresh search space
+                self.timestamp = time.time()
+        finally:
+            if owned:
+                pool.close()
+
+    def to_dict(self) -> Dict:
+        return {
+            "index": self.index,
+            "timestamp": self.timestamp,
+            "transactions": self.transactions,
+            "previous_hash": self.previous_hash,
+            "difficulty": self.difficulty,
+            "nonce": self.nonce,
+            "hash": self.hash,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Block":
+        block = cls(
+            data["index"],
+            data["transactions"],
+            data["previous_hash"],
+            data["difficulty"],
+            data["timestamp"],
+            data["nonce"],
+        )
+        return block
+
+
+class BlockStore:
+    """Append-only, memory-mapped block file with height and transaction indexes.
+
+    Files in the directory:
+      blocks.dat   - records of RECORD header + transactions JSON
+      blocks.idx   - one 8-byte file offset per height (written last, so it marks committed blocks)
+      txindex.dat  - TX_INDEX_ENTRY (tx hash, height, position) per transaction
+      checkpoint.json - height and tip hash up to which the chain has been validated
+    """
+
+    def __init__(self, directory: str = "chain_data"):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.data_path = os.path.join(directory, "blocks.dat")
+        self.index_path = os.path.join(directory, "blocks.idx")
+        self.tx_index_path = os.path.join(directory, "txindex.dat")
+        self.checkpoint_path = os.path.join(directory, "checkpoint.json")
+
+        self.offsets = array("Q")
+        self.tx_index: Dict[bytes, Tuple[int, int]] = {}
+        self._mmap = None
+        self._mapped_size = 0
+        # (height, header, transactions) of the last appended block, so reading the tip
+        # right after an append does not remap the grown file
+        self._tip = None
+        self._size = os.path.getsize(self.data_path) if os.path.exists(self.data_path) else 0
+
+        self._load_indexes()
+        self._data = open(self.data_path, "ab")
+        self._index = open(self.index_path, "ab")
+        self._tx_index = open(self.tx_index_path, "ab")
+        self._recover_tail()
+
+    def _load_indexes(self):
+        """Read the persisted indexes, dropping any entries past the last complete one"""
+        data_size = self._size
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as f:
+                raw = f.read()
+            self.offsets.frombytes(raw[:len(raw) - len(raw) % self.offsets.itemsize])
+            while self.offsets and self.offsets[-1] >= data_size:
+                self.offsets.pop()
+            with open(self.index_path, "r+b") as f:
+                f.truncate(len(self.offsets) * self.offsets.itemsize)
+
+        if os.path.exists(self.tx_index_path):
+            with open(self.tx_index_path, "rb") as f:
+                raw = f.read()
+            valid = 0
+            for tx_hash, height, position in TX_INDEX_ENTRY.iter_unpack(raw[:len(raw) - len(raw) % TX_INDEX_ENTRY.size]):
+                if height >= len(self.offsets):
+                    break
+                self.tx_index[tx_hash] = (height, position)
+                valid += TX_INDEX_ENTRY.size
+            with open(self.tx_index_path, "r+b") as f:
+                f.truncate(valid)
+
+    def _recover_tail(self):
+        """Index blocks written after the last index update and cut off a torn final record"""
+        size = self._size
+        offset = 0
+        if self.offsets:
+            offset = self.offsets[-1] + RECORD.unpack_from(self._view(), self.offsets[-1])[0]
+        while offset + RECORD.size <= size:
+            length = RECORD.unpack_from(self._view(), offset)[0]
+            if length < RECORD.size or offset + length > size:
+                break
+            hashes = [transaction_hash(tx) for tx in self._read_transactions(offset)]
+            self._index_block(offset, len(self.offsets), hashes)
+            offset += length
+        if offset < size:
+            self._unmap()
+            self._data.truncate(offset)
+            self._data.seek(offset)
+            self._size = offset
+            self.clear_checkpoint()
+
+    def _view(self):
+        """Memory map covering every byte appended so far"""
+        if self._mmap is None or self._mapped_size < self._size:
+            self._unmap()
+            if self._size == 0:
+                return b""
+            with open(self.data_path, "rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_size = len(self._mmap)
+        return self._mmap
+
+    def _unmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self._mapped_size = 0
+
+    def _read_transactions(self, offset: int) -> List[Dict]:
+        view = self._view()
+        length = RECORD.unpack_from(view, offset)[0]
+        return json.loads(view[offset + RECORD.size:offset + length])
+
+    def _index_block(self, offset: int, height: int, tx_hashes: List[bytes]):
+        for position, tx_hash in enumerate(tx_hashes):
+            self.tx_index[tx_hash] = (height, position)
+            self._tx_index.write(TX_INDEX_ENTRY.pack(tx_hash, height, position))
+        self._tx_index.flush()
+        self.offsets.append(offset)
+        self._index.write(struct.pack("<Q", offset))
+        self._index.flush()
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    def __iter__(self) -> Iterator[Block]:
+        for height in range(len(self.offsets)):
+            yield self[height]
+
+    def __getitem__(self, height: int) -> Block:
+        if height < 0:
+            height += len(self.offsets)
+        if not 0 <= height < len(self.offsets):
+            raise IndexError("block height out of range")
+        prev_hash, _, index, timestamp, bits, nonce, _ = self.read_header(height)
+        transactions = self._transactions(height)
+        return Block(index, transactions, prev_hash.hex(), bits, timestamp, nonce)
+
+    def read_header(self, height: int) -> Tuple[bytes, bytes, int, float, int, int, bytes]:
+        """(prev_hash, merkle_root, index, timestamp, bits, nonce, hash) read in place from the map"""
+        if self._tip is not None and self._tip[0] == height:
+            return self._tip[1]
+        return RECORD.unpack_from(self._view(), self.offsets[height])[1:]
+
+    def _transactions(self, height: int) -> List[Dict]:
+        if self._tip is not None and self._tip[0] == height:
+            return json.loads(self._tip[2])
+        return self._read_transactions(self.offsets[height])
+
+    def append(self, block: Block):
+        payload = json.dumps(block.transactions, separators=(",", ":")).encode("utf-8")
+        offset = self._size
+        tx_hashes = [transaction_hash(tx) for tx in block.transactions]
+        header = (
+            bytes.fromhex(block.previous_hash),
+            merkle_root(tx_hashes),
+            block.index,
+            block.timestamp,
+            block.difficulty,
+            block.nonce,
+            bytes.fromhex(block.hash),
+        )
+        self._data.write(RECORD.pack(RECORD.size + len(payload), *header))
+        self._data.write(payload)
+        self._data.flush()
+        self._size = offset + RECORD.size + len(payload)
+        self._tip = (len(self.offsets), header, payload)
+        self._index_block(offset, len(self.offsets), tx_hashes)
+
+    def find_transaction(self, tx_hash: bytes) -> Optional[Tuple[int, int]]:
+        """(height, position) of a transaction, or None"""
+        return self.tx_index.get(tx_hash)
+
+    def get_transaction_proof(self, tx_hash: bytes) -> Optional[Tuple[int, List[Tuple[bytes, bool]]]]:
+        """(height, Merkle proof) showing the transaction is included in a stored block"""
+        location = self.find_transaction(tx_hash)
+        if location is None:
+            return None
+        height, position = location
+        hashes = [transaction_hash(tx) for tx in self._transactions(height)]
+        return height, merkle_proof(hashes, position)
+
+    def verify_transaction(self, tx_hash: bytes, height: int, proof: List[Tuple[bytes, bool]]) -> bool:
+        """Check an inclusion proof against the Merkle root stored in the block header"""
+        return verify_merkle_proof(tx_hash, proof, self.read_header(height)[1])
+
+    def load_checkpoint(self) -> Tuple[int, Optional[bytes]]:
+        """(last validated height, its hash); (-1, None) when nothing has been validated"""
+        if os.path.exists(self.checkpoint_path):
+            try:
+                with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                return data["height"], bytes.fromhex(data["hash"])
+            except (json.JSONDecodeError, KeyError, ValueError):
+                pass
+        return -1, None
+
+    def save_checkpoint(self, height: int, block_hash: bytes):
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"height": height, "hash": block_hash.hex()}, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def clear_checkpoint(self):
+        if os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
+
+    def validate(self, full: bool = False) -> bool:
+        """Validate blocks added since the last checkpoint (or the whole chain when full=True)"""
+        height, tip_hash = (-1, None) if full else self.load_checkpoint()
+        if height >= len(self.offsets) or (height >= 0 and self.read_header(height)[6] != tip_hash):
+            height, tip_hash = -1, None
+
+        for h in range(height + 1, len(self.offsets)):
+            prev_hash, root, index, timestamp, bits, nonce, block_hash = self.read_header(h)
+            hashes = [transaction_hash(tx) for tx in self._transactions(h)]
+            prefix = HEADER_PREFIX.pack(prev_hash, root, index, timestamp, bits)
+            # The stored root is what inclusion proofs are checked against, so it must match the transactions
+            if (index != h
+                    or root != merkle_root(hashes)
+                    or hashlib.sha256(prefix + NONCE.pack(nonce)).digest() != block_hash
+                    or (h > 0 and (prev_hash != tip_hash or block_hash >= target_from_bits(bits)))):
+                return False
+            tip_hash = block_hash
+
+        if self.offsets:
+            self.save_checkpoint(len(self.offsets) - 1, tip_hash)
+        return True
+
+    def close(self):
+        self._unmap()
+        for f in (self._data, self._index, self._tx_index):
+            f.close()
+
+
+class Blockchain:
+    def __init__(self, difficulty: int = 16, mining_reward: float = 50.0, workers: Optional[int] = None,
+                 store: Optional[BlockStore] = None):
+        self.difficulty = difficulty
+        self.mining_reward = mining_reward
+        self.workers = workers or os.cpu_count() or 1
+        # Started on the first block hard enough to need it, then kept for later blocks
+        self.miner = MinerPool(self.workers)
+        self.pending_transactions: List[Dict] = []
+        # A BlockStore behaves like the in-memory list but keeps blocks on disk
+        self.chain = store if store is not None else []
+        if store is not None and not store.validate():
+            raise ValueError(f"Stored chain in '{store.directory}' failed validation")
+        if len(self.chain) == 0:
+            self.chain.append(self.create_genesis_block())
+
+    def create_genesis_block(self) -> Block:
+        return Block(0, [], "0" * 64, difficulty=0, timestamp=0.0)
+
+    def get_latest_block(self) -> Block:
+        return self.chain[-1]
+
+    def add_transaction(self, sender: str, recipient: str, amount: float) -> bool:
+        if not sender.strip() or not recipient.strip() or amount <= 0:
+            return False
+        self.pending_transactions.append({
+            "sender": sender.strip(),
+            "recipient": recipient.strip(),
+            "amount": amount,
+            "timestamp": time.time(),
+        })
+        return True
+
+    def mine_pending_transactions(self, miner_address: str) -> Block:
+        transactions = self.pending_transactions + [{
+            "sender": "NETWORK",
+            "recipient": miner_address,
+            "amount": self.mining_reward,
+            "height": len(self.chain),
+        }]
+        block = Block(len(self.chain), transactions, self.get_latest_block().hash, self.difficulty)
+        block.mine(pool=self.miner)
+        self.chain.append(block)
+        self.pending_transactions = []
+        return block
+
+    def get_balance(self, address: str) -> float:
+        balance = 0.0
+        for block in self.chain:
+            for tx in block.transactions:
+                if tx["recipient"] == address:
+                    balance += tx["amount"]
+                if tx["sender"] == address:
+                    balance -= tx["amount"]
+        return balance
+
+    def close(self):
+        self.miner.close()
+
+    def is_chain_valid(self) -> bool:
+        previous = None
+        for current in self.chain:
+            if previous is not None:
+                if current.hash != current.calculate_hash():
+                    return False
+                if current.previous_hash != previous.hash:
+                    return False
+                if not current.meets_target():
+                    return False
+            previous = current
+        return True
+
+
+def benchmark_hashrate(nonces_per_worker: int = 200_000, max_workers: Optional[int] = None) -> List[Dict]:
+    """Measure hashes per second for 1..max_workers processes, each hashing nonces_per_worker.
+
+    The work grows with the worker count (weak scaling) and each pool is started
+    before the timer, so the result shows how hashing scales rather than process
+    startup. Efficiency is the per-worker rate relative to a single worker.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    prefix = Block(1, [], "0" * 64).header_prefix()
+    unreachable = target_from_bits(256)
+    results = []
+    for workers in range(1, max_workers + 1):
+        with MinerPool(workers) as pool:
+            pool.start()
+            # Let every worker finish importing before timing
+            pool.search(prefix, unreachable, stop=workers)
+            start = time.perf_counter()
+            _, hashes = pool.search(prefix, unreachable, stop=nonces_per_worker * workers)
+            elapsed = time.perf_counter() - start
+        rate = hashes / elapsed if elapsed > 0 else 0.0
+        results.append({
+            "workers": workers,
+            "hashes": hashes,
+            "seconds": elapsed,
+            "hashes_per_second": rate,
+            "efficiency": rate / (workers * results[0]["hashes_per_second"]) if results else 1.0,
+        })
+    return results
+
+
+def benchmark_validation(num_blocks: int = 100_000, txs_per_block: int = 4, new_blocks: int = 1_000) -> Dict:
+    """Time full vs incremental validation of a stored chain (difficulty 0, so no mining)"""
+    directory = tempfile.mkdtemp(prefix="chain_bench_")
+
+    def build(store, count):
+        for _ in range(count):
+            height = len(store)
+            previous_hash = store.read_header(height - 1)[6].hex() if height else "0" * 64
+            transactions = [
+                {"sender": f"user{i}", "recipient": f"user{i + 1}", "amount": 1.0, "height": height}
+                for i in range(txs_per_block)
+            ]
+            store.append(Block(height, transactions, previous_hash, difficulty=0, timestamp=float(height)))
+
+    try:
+        results = {"blocks": num_blocks}
+        store = BlockStore(directory)
+        start = time.perf_counter()
+        build(store, num_blocks)
+        results["write_seconds"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert store.validate(full=True)
+        results["full_validation_seconds"] = time.perf_counter() - start
+        store.close()
+
+        start = time.perf_counter()
+        store = BlockStore(directory)
+        assert store.validate()
+        results["startup_seconds"] = time.perf_counter() - start
+
+        build(store, new_blocks)
+        start = time.perf_counter()
+        assert store.validate()
+        results[f"incremental_{new_blocks}_seconds"] = time.perf_counter() - start
+
+        tx_hash = transaction_hash(store[num_blocks // 2].transactions[1])
+        start = time.perf_counter()
+        height, proof = store.get_transaction_proof(tx_hash)
+        assert store.verify_transaction(tx_hash, height, proof)
+        results["inclusion_proof_seconds"] = time.perf_counter() - start
+        store.close()
+        return results
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def print_menu():
+    print("\n🔹 MENU:")
+    print("1. 💸 Add transaction")
+    print("2. ⛏️  Mine pending transactions")
+    print("3. 🔗 View chain")
+    print("4. 💰 Check balance")
+    print("5. 🔍 Validate chain")
+    print("6. 🚀 Hashrate benchmark")
+    print("7. 🧾 Prove transaction inclusion")
+    print("8. ⏱️  Validation benchmark")
+    print("9. ❌ Exit")
+
+
+def main():
+    store = BlockStore()
+    chain = Blockchain(store=store)
+
+    while True:
+        print("\n" + "="*50)
+        print("        ⛓️  PYTHON BLOCKCHAIN")
+        print("="*50)
+        print_menu()
+
+        choice = input("\n🔸 Make your choice (1-9): ").strip()
+
+        if choice == "1":
+            sender = input("Sender: ").strip()
+            recipient = input("Recipient: ").strip()
+            try:
+                amount = float(input("Amount: "))
+                if chain.add_transaction(sender, recipient, amount):
+                    print("✅ Transaction added to the pending pool!")
+                else:
+                    print("❌ Invalid transaction!")
+            except ValueError:
+                print("❌ Invalid amount!")
+
+        elif choice == "2":
+            miner = input("Miner address: ").strip() or "miner"
+            start = time.perf_counter()
+            block = chain.mine_pending_transactions(miner)
+            elapsed = time.perf_counter() - start
+            print(f"✅ Block #{block.index} mined in {elapsed:.2f}s (nonce: {block.nonce})")
+            print(f"   🔑 Hash: {block.hash}")
+
+        elif choice == "3":
+            for block in chain.chain:
+                print("-" * 80)
+                print(f"📦 Block #{block.index} | {len(block.transactions)} tx | nonce {block.nonce}")
+                print(f"   🔑 Hash: {block.hash}")
+                print(f"   ⬅️  Prev: {block.previous_hash}")
+                for tx in block.transactions:
+                    print(f"   💸 {tx['sender']} → {tx['recipient']}: {tx['amount']}")
+                    print(f"      #️⃣  {transaction_hash(tx).hex()}")
+            print("-" * 80)
+
+        elif choice == "4":
+            address = input("Address: ").strip()
+            print(f"💰 Balance of {address}: {chain.get_balance(address):.2f}")
+
+        elif choice == "5":
+            if chain.is_chain_valid():
+                print("✅ Chain is valid!")
+            else:
+                print("❌ Chain is INVALID!")
+
+        elif choice == "6":
+            print("\n🚀 HASHRATE BENCHMARK")
+            for result in benchmark_hashrate():
+                print(f"⚙️  {result['workers']} worker(s): {result['hashes_per_second']:,.0f} H/s "
+                      f"({result['hashes']:,} hashes in {result['seconds']:.2f}s, "
+                      f"{result['efficiency']:.0%} per-core efficiency)")
+
+        elif choice == "7":
+            try:
+                tx_hash = bytes.fromhex(input("Transaction hash (hex): ").strip())
+            except ValueError:
+                print("❌ Invalid hash!")
+                continue
+            result = store.get_transaction_proof(tx_hash)
+            if result is None:
+                print("❌ Transaction not found!")
+            else:
+                height, proof = result
+                verified = store.verify_transaction(tx_hash, height, proof)
+                print(f"{'✅' if verified else '❌'} Included in block #{height} ({len(proof)} proof steps)")
+
+        elif choice == "8":
+            print("\n⏱️  VALIDATION BENCHMARK (100k blocks)")
+            for name, value in benchmark_validation().items():
+                print(f"   {name}: {value:.3f}" if isinstance(value, float) else f"   {name}: {value:,}")
+
+        elif choice == "9":
+            chain.close()
+            store.close()
+            print("\n👋 Goodbye!")
+            break
+
+        else:
+            print("❌ Invalid choice! Please enter a number between 1-9.")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n👋 Program terminated. Goodbye!")
@@ -0,0 +1,397 @@
+import random
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+EMPTY, X, O = ".", "X", "O"
+PLAYERS = (X, O)
+
+EXACT, LOWER, UPPER = 0, 1, 2
+
+
+@lru_cache(maxsize=None)
+def win_masks(n: int, k: int) -> Tuple[int, ...]:
+    """Bitmask of every k-in-a-row line on an n×n board (cell = row * n + col)"""
+    masks = []
+    for r in range(n):
+        for c in range(n):
+            for dr, dc in ((0, 1), (1, 0), (1, 1), (1, -1)):
+                end_r, end_c = r + dr * (k - 1), c + dc * (k - 1)
+                if 0 <= end_r < n and 0 <= end_c < n:
+                    mask = 0
+                    for i in range(k):
+                        mask |= 1 << ((r + dr * i) * n + c + dc * i)
+                    masks.append(mask)
+    return tuple(masks)
+
+
+@lru_cache(maxsize=None)
+def masks_by_cell(n: int, k: int) -> Tuple[Tuple[int, ...], ...]:
+    """Win masks passing through each cell, so a move only checks its own lines"""
+    return tuple(tuple(m for m in win_masks(n, k) if m >> cell & 1) for cell in range(n * n))
+
+
+@lru_cache(maxsize=None)
+def symmetries(n: int) -> Tuple[Tuple[int, ...], ...]:
+    """The 8 rotations/reflections of the square as cell permutations"""
+    transforms = [
+        lambda r, c: (r, c),
+        lambda r, c: (c, n - 1 - r),
+        lambda r, c: (n - 1 - r, n - 1 - c),
+        lambda r, c: (n - 1 - c, r),
+        lambda r, c: (r, n - 1 - c),
+        lambda r, c: (n - 1 - r, c),
+        lambda r, c: (c, r),
+        lambda r, c: (n - 1 - c, n - 1 - r),
+    ]
+    perms = []
+    for t in transforms:
+        perm = []
+        for cell in range(n * n):
+            r, c = t(*divmod(cell, n))
+            perm.append(r * n + c)
+        perms.append(tuple(perm))
+    return tuple(perms)
+
+
+@lru_cache(maxsize=None)
+def zobrist_table(n: int) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    rng = random.Random(n)
+    return tuple(tuple(rng.getrandbits(64) for _ in range(n * n)) for _ in PLAYERS)
+
+
+class TicTacToe:
+    """N×N board with k-in-a-row wins, stored as one bitboard per player"""
+
+    def __init__(self, n: int = 3, k: Optional[int] = None):
+        self.n = n
+        self.k = k or n
+        self.size = n * n
+        self.full_mask = (1 << self.size) - 1
+        self.bits = [0, 0]
+        self.turn = 0  # index into PLAYERS
+        self.history: List[int] = []
+        self.winner: Optional[str] = None
+        self._line_masks = masks_by_cell(n, self.k)
+        self.symmetries = symmetries(n)
+        self._zobrist = zobrist_table(n)
+        # One Zobrist hash per symmetry; their minimum identifies the position up to symmetry
+        self.sym_hashes = [0] * len(self.symmetries)
+        # Centre-first move order helps alpha-beta cut earlier
+        centre = (n - 1) / 2
+        self.move_order = sorted(range(self.size),
+                                 key=lambda cell: abs(cell // n - centre) + abs(cell % n - centre))
+
+    def current_player(self) -> str:
+        return PLAYERS[self.turn]
+
+    def is_empty(self, cell: int) -> bool:
+        return not ((self.bits[0] | self.bits[1]) >> cell & 1)
+
+    def available_moves(self) -> List[int]:
+        occupied = self.bits[0] | self.bits[1]
+        return [cell for cell in self.move_order if not occupied >> cell & 1]
+
+    def is_full(self) -> bool:
+        return (self.bits[0] | self.bits[1]) == self.full_mask
+
+    def is_over(self) -> bool:
+        return self.winner is not None or self.is_full()
+
+    def make_move(self, cell: int) -> bool:
+        """Place the current player's mark; returns True if the move wins"""
+        side = self.turn
+        bits = self.bits[side] | (1 << cell)
+        self.bits[side] = bits
+        zobrist = self._zobrist[side]
+        for i, perm in enumerate(self.symmetries):
+            self.sym_hashes[i] ^= zobrist[perm[cell]]
+        self.history.append(cell)
+        self.turn ^= 1
+        for mask in self._line_masks[cell]:
+            if bits & mask == mask:
+                self.winner = PLAYERS[side]
+                return True
+        return False
+
+    def undo_move(self):
+        cell = self.history.pop()
+        self.turn ^= 1
+        side = self.turn
+        self.bits[side] &= ~(1 << cell)
+        zobrist = self._zobrist[side]
+        for i, perm in enumerate(self.symmetries):
+            self.sym_hashes[i] ^= zobrist[perm[cell]]
+        self.winner = None
+
+    def display(self):
+        print()
+        header = "    " + " ".join(f"{c + 1:>2}" for c in range(self.n))
+        print(header)
+        for r in range(self.n):
+            row = []
+            for c in range(self.n):
+                cell = r * self.n + c
+                if self.bits[0] >> cell & 1:
+                    row.append(" ❌")
+                elif self.bits[1] >> cell & 1:
+                    row.append(" ⭕")
+                else:
+                    row.append(" ⬜")
+            print(f"{r + 1:>2} " + "".join(row))
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class AIPlayer:
+    """Alpha-beta negamax with a symmetry-reduced transposition table and iterative deepening.
+
+    Scores are from the side to move: a win is worth (empty cells + 1) so quicker wins
+    score higher, draws are 0, and heuristic leaf scores stay strictly within (-1, 1).
+    """
+
+    def __init__(self):
+        self.table: Dict[int, Tuple[int, float, int, int]] = {}
+        self.nodes = 0
+        self.deadline: Optional[float] = None
+
+    def evaluate(self, game: TicTacToe) -> float:
+        """Open-line heuristic for the side to move"""
+        mine, theirs = game.bits[game.turn], game.bits[game.turn ^ 1]
+        score = 0
+        for mask in win_masks(game.n, game.k):
+            own, other = (mine & mask).bit_count(), (theirs & mask).bit_count()
+            if own and not other:
+                score += own * own
+            elif other and not own:
+                score -= other * other
+        return score / (len(win_masks(game.n, game.k)) * game.k * game.k + 1)
+
+    def _canonical(self, game: TicTacToe) -> Tuple[int, int]:
+        """(hash, symmetry index) of the canonical orientation of the position"""
+        hashes = game.sym_hashes
+        key = min(hashes)
+        return key, hashes.index(key)
+
+    def negamax(self, game: TicTacToe, depth: int, alpha: float, beta: float) -> float:
+        self.nodes += 1
+        if self.deadline is not None and not self.nodes & 1023 and time.perf_counter() > self.deadline:
+            raise SearchTimeout()
+
+        empties = game.size - len(game.history)
+        if empties == 0:
+            return 0
+        if depth == 0:
+            return self.evaluate(game)
+
+        key, sym = self._canonical(game)
+        perm = game.symmetries[sym]
+        best_move = -1
+        entry = self.table.get(key)
+        if entry is not None:
+            entry_depth, value, flag, canonical_move = entry
+            if entry_depth >= depth:
+                if flag == EXACT:
+                    return value
+                if flag == LOWER and value >= beta:
+                    return value
+                if flag == UPPER and value <= alpha:
+                    return value
+            best_move = perm.index(canonical_move)
+
+        moves = game.available_moves()
+        if best_move in moves:
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+
+        original_alpha = alpha
+        best = float("-inf")
+        for move in moves:
+            if game.make_move(move):
+                score = empties
+            else:
+                score = -self.negamax(game, depth - 1, -beta, -alpha)
+            game.undo_move()
+            if score > best:
+                best, best_move = score, move
+            if best > alpha:
+                alpha = best
+            if alpha >= beta:
+                break
+
+        flag = EXACT
+        if best <= original_alpha:
+            flag = UPPER
+        elif best >= beta:
+            flag = LOWER
+        self.table[key] = (depth, best, flag, perm[best_move])
+        return best
+
+    def search(self, game: TicTacToe, time_budget: Optional[float] = None,
+               max_depth: Optional[int] = None) -> Dict:
+        """Iterative deepening until solved, max_depth is reached or the time budget runs out"""
+        self.nodes = 0
+        start = time.perf_counter()
+        self.deadline = start + time_budget if time_budget else None
+        empties = game.size - len(game.history)
+        max_depth = min(max_depth or empties, empties)
+        result = {"move": game.available_moves()[0], "score": 0.0, "depth": 0, "solved": False}
+
+        root_moves = len(game.history)
+        for depth in range(1, max_depth + 1):
+            try:
+                best_move, best_score = None, float("-inf")
+                for move in self._root_moves(game):
+                    if game.make_move(move):
+                        score = empties
+                    else:
+                        score = -self.negamax(game, depth - 1, float("-inf"), -best_score)
+                    game.undo_move()
+                    if score > best_score:
+                        best_move, best_score = move, score
+            except SearchTimeout:
+                while len(game.history) > root_moves:
+                    game.undo_move()
+                break
+
+            key, sym = self._canonical(game)
+            self.table[key] = (depth, best_score, EXACT, game.symmetries[sym][best_move])
+            result = {"move": best_move, "score": best_score, "depth": depth,
+                      "solved": depth == empties or abs(best_score) >= 1}
+            if result["solved"]:
+                break
+
+        self.deadline = None
+        result["nodes"] = self.nodes
+        result["seconds"] = time.perf_counter() - start
+        return result
+
+    def _root_moves(self, game: TicTacToe) -> List[int]:
+        """Legal moves with the table's previous best first"""
+        moves = game.available_moves()
+        key, sym = self._canonical(game)
+        entry = self.table.get(key)
+        if entry is not None:
+            best = game.symmetries[sym].index(entry[3])
+            if best in moves:
+                moves.remove(best)
+                moves.insert(0, best)
+        return moves
+
+    def best_move(self, game: TicTacToe, time_budget: Optional[float] = None) -> int:
+        return self.search(game, time_budget)["move"]
+
+
+def benchmark() -> List[Dict]:
+    """Nodes per second and time to fully solve the empty 3×3 and 4×4 boards"""
+    results = []
+    for n in (3, 4):
+        game = TicTacToe(n)
+        ai = AIPlayer()
+        result = ai.search(game)
+        results.append({
+            "board": f"{n}x{n}",
+            "score": result["score"],
+            "solved": result["solved"],
+            "nodes": result["nodes"],
+            "seconds": result["seconds"],
+            "nodes_per_second": result["nodes"] / result["seconds"] if result["seconds"] > 0 else 0.0,
+            "table_entries": len(ai.table),
+        })
+    return results
+
+
+def ask_board_size() -> Tuple[int, int]:
+    try:
+        n = int(input("Board size N (default: 3): ").strip() or 3)
+        k = int(input(f"Marks in a row to win (default: {min(n, 4)}): ").strip() or min(n, 4))
+    except ValueError:
+        print("❌ Invalid number, using 3×3.")
+        return 3, 3
+    if n < 3 or not 3 <= k <= n:
+        print("❌ Invalid size, using 3×3.")
+        return 3, 3
+    return n, k
+
+
+def ask_move(game: TicTacToe) -> int:
+    while True:
+        raw = input(f"{game.current_player()} move as 'row col': ").replace(",", " ").split()
+        try:
+            r, c = (int(v) - 1 for v in raw)
+        except ValueError:
+            print("❌ Enter two numbers, e.g. '2 3'.")
+            continue
+        if 0 <= r < game.n and 0 <= c < game.n and game.is_empty(r * game.n + c):
+            return r * game.n + c
+        print("❌ That cell is not available!")
+
+
+def play(vs_computer: bool):
+    n, k = ask_board_size()
+    game = TicTacToe(n, k)
+    ai = AIPlayer()
+    time_budget = 1.0 if n == 3 else 3.0
+    human = X
+    if vs_computer:
+        human = O if input("Play first? (y/n, default: y): ").strip().lower() == "n" else X
+
+    while not game.is_over():
+        game.display()
+        if vs_computer and game.current_player() != human:
+            result = ai.search(game, time_budget)
+            move = result["move"]
+            print(f"🤖 Computer plays {move // n + 1} {move % n + 1} "
+                  f"(depth {result['depth']}, {result['nodes']:,} nodes)")
+        else:
+            move = ask_move(game)
+        game.make_move(move)
+
+    game.display()
+    if game.winner:
+        print(f"\n🏆 {game.winner} wins!")
+    else:
+        print("\n🤝 It's a draw!")
+
+
+def print_menu():
+    print("\n🔹 MENU:")
+    print("1. 🤖 Play against the computer")
+    print("2. 👥 Two players")
+    print("3. 🚀 Engine benchmark")
+    print("4. ❌ Exit")
+
+
+def main():
+    while True:
+        print("\n" + "="*50)
+        print("        🎮 PYTHON TIC TAC TOE")
+        print("="*50)
+        print_menu()
+
+        choice = input("\n🔸 Make your choice (1-4): ").strip()
+
+        if choice == "1":
+            play(vs_computer=True)
+        elif choice == "2":
+            play(vs_computer=False)
+        elif choice == "3":
+            print("\n🚀 ENGINE BENCHMARK (full solve)")
+            for result in benchmark():
+                outcome = "draw" if result["score"] == 0 else ("first player wins" if result["score"] > 0 else "second player wins")
+                print(f"🧩 {result['board']}: {outcome} | {result['nodes']:,} nodes in {result['seconds']:.2f}s "
+                      f"({result['nodes_per_second']:,.0f} nodes/s, {result['table_entries']:,} table entries)")
+        elif choice == "4":
+            print("\n👋 Goodbye!")
+            break
+        else:
+            print("❌ Invalid choice! Please enter a number between 1-4.")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        print("\n\n👋 Program terminated. Goodbye!")
@@ -1,24 +1,440 @@
 
+import csv
+import hashlib
 import json
 import os
-from datetime import datetime
-from typing import List, Dict
+import shutil
+import struct
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, List, Dict, Optional
+
+CHUNK_SIZE = 1 << 20
+
+def iter_todo_records(filename: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Dict]:
+    """Yield the objects of a JSON array file one at a time, reading it in chunks.
+
+    Raises json.JSONDecodeError at the first malformed record, after every
+    record before it has been yielded.
+    """
+    decoder = json.JSONDecoder()
+    with open(filename, 'r', encoding='utf-8') as f:
+        buf = ""
+        pos = 0
+        
+        def next_char() -> str:
+            """Skip whitespace (reading more if needed) and return the next character, or '' at EOF"""
+            nonlocal buf, pos
+            while True:
+                while pos < len(buf) and buf[pos] in " \t\r\n":
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    return ""
+                buf, pos = chunk, 0
+        
+        char = next_char()
+        if char == "":
+            return
+        if char != "[":
+            raise json.JSONDecodeError("Expected '['", buf, pos)
+        pos += 1
+        
+        if next_char() != "]":
+            while True:
+                next_char()
+                while True:
+                    try:
+                        record, pos = decoder.raw_decode(buf, pos)
+                        break
+                    except json.JSONDecodeError as e:
+                        # Only a record cut by the chunk boundary is worth reading more for:
+                        # the error then sits in the last few characters (a cut literal or
+                        # number) or in an unclosed string. Anything earlier is real
+                        # corruption, so stop instead of buffering the rest of the file.
+                        if e.pos < len(buf) - 64 and not e.msg.startswith("Unterminated string"):
+                            raise
+                        chunk = f.read(chunk_size)
+                        if not chunk:
+                            raise
+                        buf, pos = buf[pos:] + chunk, 0
+                yield record
+                
+                char = next_char()
+                if char == "]":
+                    break
+                if char != ",":
+                    raise json.JSONDecodeError("Expected ',' or ']'", buf, pos)
+                pos += 1
+        pos += 1
+        
+        if next_char():
+            raise json.JSONDecodeError("Extra data after the task list", buf, pos)
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+CSV_FIELDS = ["id", "task", "completed", "priority", "created_at", "completed_at"]
+FORMATS = {".ndjson": "ndjson", ".jsonl": "ndjson", ".csv": "csv", ".todo": "binary", ".bin": "binary"}
+
+# Binary format: magic, then per task RECORD (id, flags, created, completed, task length)
+# followed by the UTF-8 task text. Times are UTC-naive epoch seconds, 0 meaning None.
+# flags: bit 0 = completed, bits 1-2 = priority code; code 3 means a 1-byte length
+# and the priority text follow the task.
+BINARY_MAGIC = b"TODOBIN1"
+RECORD = struct.Struct("<QBIII")
+PRIORITY_CODES = {"normal": 0, "high": 1, "low": 2}
+PRIORITY_NAMES = {code: name for name, code in PRIORITY_CODES.items()}
+
+def detect_format(path: str, fmt: Optional[str] = None) -> str:
+    if fmt:
+        if fmt not in FORMATS.values():
+            raise ValueError(f"Unknown format '{fmt}' (use ndjson, csv or binary)")
+        return fmt
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in FORMATS:
+        raise ValueError(f"Cannot tell the format of '{path}' (use .ndjson, .csv or .todo)")
+    return FORMATS[ext]
+
+EPOCH = datetime(1970, 1, 1)
+ONE_SECOND = timedelta(seconds=1)
+
+def _pack_time(value: Optional[str]) -> int:
+    if not value:
+        return 0
+    return (datetime.fromisoformat(value) - EPOCH) // ONE_SECOND
+
+def _unpack_time(value: int) -> Optional[str]:
+    if not value:
+        return None
+    # isoformat(" ") yields the same text as TIME_FORMAT and is much cheaper than strftime
+    return (EPOCH + timedelta(seconds=value)).isoformat(" ")
+
+BOOLEAN_TEXT = {"true": True, "1": True, "yes": True, "false": False, "0": False, "no": False, "": False}
+
+def _parse_bool(value) -> bool:
+    if value is None or isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in BOOLEAN_TEXT:
+        return BOOLEAN_TEXT[value.strip().lower()]
+    raise ValueError(f"'completed' must be true or false, not {value!r}")
+
+def _parse_time(value, field: str) -> Optional[str]:
+    """Return value as TIME_FORMAT text, converting ISO 8601 and aware times to local time"""
+    if value is None or value == "":
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{field}' is not a date and time: {value!r}") from None
+    if moment.tzinfo is not None:
+        moment = moment.astimezone().replace(tzinfo=None)
+    # The binary export stores whole seconds since 1970 in 32 bits
+    if not 0 < (moment - EPOCH) // ONE_SECOND < 1 << 32:
+        raise ValueError(f"'{field}' is outside 1970-2106: {value!r}")
+    return moment.strftime(TIME_FORMAT)
+
+def normalize_record(todo: Dict) -> Dict:
+    """Coerce an imported record into the stored task layout, raising ValueError if it does not fit.
+
+    The id is None unless it is a usable positive integer, and created_at is None
+    when the record has none, so the caller can assign both.
+    """
+    todo_id, task, priority = todo.get("id"), todo.get("task", ""), todo.get("priority")
+    if not isinstance(task, str):
+        raise ValueError(f"'task' must be text, not {task!r}")
+    if priority is not None and not isinstance(priority, str):
+        raise ValueError(f"'priority' must be text, not {priority!r}")
+    usable_id = isinstance(todo_id, int) and not isinstance(todo_id, bool) and 0 < todo_id < 1 << 64
+    return {
+        "id": todo_id if usable_id else None,
+        "task": task.strip(),
+        "completed": _parse_bool(todo.get("completed")),
+        "priority": (priority or "").strip().lower() or "normal",
+        "created_at": _parse_time(todo.get("created_at"), "created_at"),
+        "completed_at": _parse_time(todo.get("completed_at"), "completed_at"),
+    }
+
+def content_hash(todo: Dict) -> int:
+    """64-bit hash of everything but the id, used to spot the same task under another id"""
+    payload = "\x1f".join(str(todo.get(field)) for field in CSV_FIELDS[1:])
+    return int.from_bytes(hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest(), "little")
+
+def write_records(records: Iterable[Dict], path: str, fmt: Optional[str] = None) -> int:
+    """Stream tasks to path one record at a time; returns the number written.
+
+    The file is written under a temporary name and renamed into place only once
+    every record has been written, so a failed export leaves nothing behind.
+    """
+    fmt = detect_format(path, fmt)
+    tmp_path = path + ".tmp"
+    count = 0
+    done = False
+    try:
+        if fmt == "ndjson":
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for todo in records:
+                    f.write(json.dumps(todo, ensure_ascii=False))
+                    f.write("\n")
+                    count += 1
+        elif fmt == "csv":
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(CSV_FIELDS)
+                for todo in records:
+                    writer.writerow([
+                        todo["id"], todo["task"], int(todo["completed"]), todo["priority"],
+                        todo["created_at"] or "", todo["completed_at"] or "",
+                    ])
+                    count += 1
+        else:
+            with open(tmp_path, 'wb') as f:
+                f.write(BINARY_MAGIC)
+                for todo in records:
+                    task = todo["task"].encode("utf-8")
+                    code = PRIORITY_CODES.get(todo["priority"], 3)
+                    f.write(RECORD.pack(
+                        todo["id"], bool(todo["completed"]) | code << 1,
+                        _pack_time(todo["created_at"]), _pack_time(todo["completed_at"]), len(task),
+                    ))
+                    f.write(task)
+                    if code == 3:
+                        priority = todo["priority"].encode("utf-8")[:255].decode("utf-8", "ignore").encode("utf-8")
+                        f.write(bytes((len(priority),)) + priority)
+                    count += 1
+        done = True
+    except (KeyError, TypeError, AttributeError, ValueError, OverflowError, struct.error) as e:
+        raise ValueError(f"Task #{count + 1} cannot be exported ({type(e).__name__}: {e})") from e
+    finally:
+        if not done and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    os.replace(tmp_path, path)
+    return count
+
+def read_records(path: str, fmt: Optional[str] = None) -> Iterator[Dict]:
+    """Yield tasks from an export file one record at a time"""
+    fmt = detect_format(path, fmt)
+    if fmt == "ndjson":
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                if line.strip():
+                    todo = json.loads(line)
+                    if not isinstance(todo, dict):
+                        raise ValueError(f"'{path}' line {line_no} is not a task object")
+                    yield todo
+    elif fmt == "csv":
+        with open(path, 'r', encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            if next(reader, None) != CSV_FIELDS:
+                raise ValueError(f"'{path}' does not start with the header {','.join(CSV_FIELDS)}")
+            for todo_id, task, completed, priority, created_at, completed_at in reader:
+                yield {
+                    "id": int(todo_id),
+                    "task": task,
+                    "completed": completed in ("1", "true", "True"),
+                    "priority": priority,
+                    "created_at": created_at or None,
+                    "completed_at": completed_at or None,
+                }
+    else:
+        with open(path, 'rb') as f:
+            if f.read(len(BINARY_MAGIC)) != BINARY_MAGIC:
+                raise ValueError(f"'{path}' is not a binary task export")
+            while True:
+                header = f.read(RECORD.size)
+                if not header:
+                    return
+                if len(header) < RECORD.size:
+                    raise ValueError(f"'{path}' ends in the middle of a record")
+                todo_id, flags, created, completed, task_len = RECORD.unpack(header)
+                task = f.read(task_len)
+                if len(task) < task_len:
+                    raise ValueError(f"'{path}' ends in the middle of a record")
+                task = task.decode("utf-8")
+                code = flags >> 1 & 3
+                if code == 3:
+                    length = f.read(1)
+                    priority = f.read(length[0]) if length else b""
+                    if not length or len(priority) < length[0]:
+                        raise ValueError(f"'{path}' ends in the middle of a record")
+                    priority = priority.decode("utf-8")
+                else:
+                    priority = PRIORITY_NAMES[code]
+                yield {
+                    "id": todo_id,
+                    "task": task,
+                    "completed": bool(flags & 1),
+                    "priority": priority,
+                    "created_at": _unpack_time(created),
+                    "completed_at": _unpack_time(completed),
+                }
+
+def _throughput(count: int, skipped: int, path: str, seconds: float) -> Dict:
+    size = os.path.getsize(path)
+    return {
+        "records": count,
+        "skipped": skipped,
+        "bytes": size,
+        "seconds": seconds,
+        "records_per_second": count / seconds if seconds > 0 else 0.0,
+        "mb_per_second": size / 1e6 / seconds if seconds > 0 else 0.0,
+    }
+
+def dedupe_records(records: Iterable[Dict], key: str = "id", seen: Optional[set] = None) -> Iterator[Dict]:
+    """Drop records whose id (key="id") or content hash (key="hash") has been seen before"""
+    if key not in ("id", "hash"):
+        raise ValueError(f"Unknown dedupe key '{key}' (use id or hash)")
+    seen = set() if seen is None else seen
+    for todo in records:
+        marker = todo.get("id") if key == "id" else content_hash(todo)
+        if marker is None:
+            yield todo
+            continue
+        if marker in seen:
+            continue
+        seen.add(marker)
+        yield todo
+
+def benchmark_io(count: int = 1_000_000, directory: Optional[str] = None) -> List[Dict]:
+    """Time TodoApp.export_todos and import_todos on count synthetic tasks in every format.
+
+    Both sides hold the full task list in memory, and each import also re-saves
+    the JSON store, exactly as the export/import commands do.
+    """
+    workdir = tempfile.mkdtemp(prefix="todo_bench_", dir=directory)
+    source = TodoApp(os.path.join(workdir, "source.json"), background=False)
+    source.todos = [
+        {
+            "id": i + 1,
+            "task": f"Synced task #{i} from the upstream tracker",
+            "completed": i % 3 == 0,
+            "priority": ("high", "normal", "low")[i % 3],
+            "created_at": "2026-01-01 09:00:00",
+            "completed_at": "2026-01-02 17:30:00" if i % 3 == 0 else None,
+        }
+        for i in range(count)
+    ]
+    results = []
+    try:
+        for fmt, ext in (("ndjson", ".ndjson"), ("csv", ".csv"), ("binary", ".todo")):
+            path = os.path.join(workdir, "tasks" + ext)
+            stats = source.export_todos(path)
+            results.append({"format": fmt, "direction": "export", **stats})
+            
+            target = TodoApp(os.path.join(workdir, f"imported_{fmt}.json"), background=False)
+            stats = target.import_todos(path)
+            results.append({"format": fmt, "direction": "import", **stats})
+            del target
+            os.remove(path)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+def print_io_stats(stats: Dict, action: str):
+    print(f"✅ {action} {stats['records']:,} tasks ({stats['skipped']:,} duplicates skipped)")
+    print(f"   ⚡ {stats['records_per_second']:,.0f} tasks/s, {stats['mb_per_second']:.1f} MB/s "
+          f"({stats['bytes'] / 1e6:.1f} MB in {stats['seconds']:.2f}s)")
 
 class TodoApp:
-    def __init__(self, filename: str = "todos.json"):
+    def __init__(self, filename: str = "todos.json", background: bool = True):
         self.filename = filename
-        self.todos = self.load_todos()
+        self.todos: List[Dict] = []
+        self.load_error: Optional[str] = None
+        # Set when a load stopped early and the original file still needs its backup
+        self._backup_pending = False
+        self._loaded = threading.Event()
+        
+        if background:
+            # Records stream into self.todos while the menu is already usable
+            threading.Thread(target=self._load_in_background, daemon=True).start()
+        else:
+            self.todos = self.load_todos()
+            self._loaded.set()
     
     def load_todos(self) -> List[Dict]:
-        if os.path.exists(self.filename):
-            try:
-                with open(self.filename, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                return []
-        return []
+        todos = []
+        self._stream_into(todos)
+        return todos
+    
+    def _stream_into(self, todos: List[Dict]):
+        if not os.path.exists(self.filename):
+            return
+        try:
+            for todo in iter_todo_records(self.filename):
+                todos.append(todo)
+        except json.JSONDecodeError as e:
+            self._load_failed(f"is corrupted after task #{len(todos)} ({e.msg})", len(todos))
+        except UnicodeDecodeError as e:
+            self._load_failed(f"is not valid UTF-8 after task #{len(todos)} ({e.reason})", len(todos))
+        except OSError as e:
+            self._load_failed(f"could not be read ({e})", len(todos))
+    
+    def _load_failed(self, problem: str, kept: int):
+        """Back up a file that only loaded partially so the next save cannot destroy it"""
+        self._backup_pending = True
+        backup = self.filename + ".corrupt"
+        if self._backup_original():
+            self.load_error = (f"{self.filename} {problem}; "
+                               f"kept the {kept} readable tasks, original saved to {backup}")
+        else:
+            self.load_error = (f"{self.filename} {problem}; kept the {kept} readable tasks, "
+                               f"but changes will not be saved until it can be copied to {backup}")
+    
+    def _backup_original(self) -> bool:
+        if not self._backup_pending:
+            return True
+        try:
+            shutil.copyfile(self.filename, self.filename + ".corrupt")
+        except OSError:
+            return False
+        self._backup_pending = False
+        return True
+    
+    def _load_in_background(self):
+        try:
+            self._stream_into(self.todos)
+        finally:
+            self._loaded.set()
+    
+    @property
+    def is_loaded(self) -> bool:
+        return self._loaded.is_set()
+    
+    def wait_until_loaded(self):
+        self._loaded.wait()
+    
+    def first_page(self, page_size: int = 10, filter_status: str = "all", timeout: float = 0.2) -> List[Dict]:
+        """Return up to page_size matching tasks as soon as they have been read.
+
+        Gives up after timeout seconds and returns whatever has matched so far.
+        """
+        deadline = time.perf_counter() + timeout
+        matches = []
+        scanned = 0
+        while True:
+            loaded = self.is_loaded
+            # Only look at records that arrived since the previous poll
+            end = len(self.todos)
+            for todo in self.todos[scanned:end]:
+                if (filter_status == "all"
+                        or (filter_status == "pending") != todo["completed"]):
+                    matches.append(todo)
+                    if len(matches) >= page_size:
+                        return matches
+            scanned = end
+            if loaded or time.perf_counter() >= deadline:
+                return matches
+            self._loaded.wait(0.01)
     
     def save_todos(self):
+        if not self._backup_original():
+            print(f"Save error: {self.filename} loaded only partially and could not be backed up, not overwriting it")
+            return
         try:
             with open(self.filename, 'w', encoding='utf-8') as f:
                 json.dump(self.todos, f, ensure_ascii=False, indent=2)
@@ -26,6 +442,7 @@ class TodoApp:
             print(f"Save error: {e}")
     
     def add_todo(self, task: str, priority: str = "normal") -> bool:
+        self.wait_until_loaded()
         if not task.strip():
             return False
         
@@ -43,6 +460,7 @@ class TodoApp:
         return True
     
     def complete_todo(self, todo_id: int) -> bool:
+        self.wait_until_loaded()
         for todo in self.todos:
             if todo["id"] == todo_id:
                 todo["completed"] = True
@@ -52,6 +470,7 @@ class TodoApp:
         return False
     
     def delete_todo(self, todo_id: int) -> bool:
+        self.wait_until_loaded()
         initial_length = len(self.todos)
         self.todos = [todo for todo in self.todos if todo["id"] != todo_id]
         
@@ -61,6 +480,7 @@ class TodoApp:
         return False
     
     def edit_todo(self, todo_id: int, new_task: str) -> bool:
+        self.wait_until_loaded()
         if not new_task.strip():
             return False
         
@@ -72,6 +492,7 @@ class TodoApp:
         return False
     
     def list_todos(self, filter_status: str = "all") -> List[Dict]:
+        self.wait_until_loaded()
         if filter_status == "completed":
             return [todo for todo in self.todos if todo["completed"]]
         elif filter_status == "pending":
@@ -79,7 +500,60 @@ class TodoApp:
         else:
             return self.todos
     
+    def export_todos(self, path: str, fmt: Optional[str] = None) -> Dict:
+        """Write all tasks to an NDJSON, CSV or binary file; returns throughput stats"""
+        self.wait_until_loaded()
+        start = time.perf_counter()
+        count = write_records(self.todos, path, fmt)
+        return _throughput(count, 0, path, time.perf_counter() - start)
+    
+    def import_todos(self, path: str, fmt: Optional[str] = None, dedupe: str = "id") -> Dict:
+        """Append tasks from an export file, skipping ones already present by id or content hash"""
+        self.wait_until_loaded()
+        start = time.perf_counter()
+        ids = {t["id"] for t in self.todos}
+        if dedupe == "id":
+            seen = set(ids)
+        else:
+            # Imported records without created_at hash as None, so match stored tasks that way too
+            seen = {content_hash(t) for t in self.todos}
+            seen.update(content_hash({**t, "created_at": None}) for t in self.todos)
+        next_id = max(ids, default=0) + 1
+        read = added = 0
+        
+        def normalized(records):
+            # Dedupe has to compare records in the same shape as the stored tasks
+            nonlocal read
+            for todo in records:
+                read += 1
+                try:
+                    todo = normalize_record(todo)
+                except ValueError as e:
+                    raise ValueError(f"Record #{read} of '{path}' is not a valid task ({e})") from e
+                yield todo
+        
+        imported_from = len(self.todos)
+        now = datetime.now().strftime(TIME_FORMAT)
+        try:
+            for todo in dedupe_records(normalized(read_records(path, fmt)), dedupe, seen):
+                if todo["id"] is None or todo["id"] in ids:
+                    todo["id"] = next_id
+                todo["created_at"] = todo["created_at"] or now
+                ids.add(todo["id"])
+                next_id = max(next_id, todo["id"] + 1)
+                self.todos.append(todo)
+                added += 1
+        except ValueError:
+            # Leave the task list as it was rather than half-imported
+            del self.todos[imported_from:]
+            raise
+        
+        if added:
+            self.save_todos()
+        return _throughput(added, read - added, path, time.perf_counter() - start)
+    
     def get_stats(self) -> Dict:
+        self.wait_until_loaded()
         total = len(self.todos)
         completed = len([t for t in self.todos if t["completed"]])
         pending = total - completed
@@ -110,7 +584,9 @@ def print_menu():
     print("5. 🗑️  Delete task")
     print("6. 📊 Statistics")
     print("7. 🔍 Filtered list")
-    print("8. ❌ Exit")
+    print("8. 📤 Export tasks")
+    print("9. 📥 Import tasks")
+    print("10. ❌ Exit")
 
 def display_todos(todos: List[Dict], title: str = "TASKS"):
     if not todos:
@@ -142,11 +618,23 @@ def get_priority():
 def main():
     app = TodoApp()
     
+    print_header()
+    first_page = app.first_page(filter_status="pending")
+    if first_page or app.is_loaded:
+        display_todos(first_page, "PENDING TASKS (first page)")
+    if not app.is_loaded:
+        print(f"⏳ Loading remaining tasks in the background... ({len(app.todos)} read so far)")
+    
+    load_error_shown = False
     while True:
         print_header()
         print_menu()
         
-        choice = input("\n🔸 Make your choice (1-8): ").strip()
+        if app.load_error and not load_error_shown:
+            print(f"\n⚠️ {app.load_error}")
+            load_error_shown = True
+        
+        choice = input("\n🔸 Make your choice (1-10): ").strip()
         
         if choice == "1":
             print("\n➕ ADD NEW TASK")
@@ -231,15 +719,57 @@ def main():
                 display_todos(app.list_todos(), "ALL TASKS")
         
         elif choice == "8":
+            print("\n📤 EXPORT TASKS")
+            path = input("File name (.ndjson, .csv or .todo): ").strip()
+            try:
+                print_io_stats(app.export_todos(path), "Exported")
+            except (OSError, ValueError) as e:
+                print(f"❌ Export failed: {e}")
+        
+        elif choice == "9":
+            print("\n📥 IMPORT TASKS")
+            path = input("File name (.ndjson, .csv or .todo): ").strip()
+            dedupe = "hash" if input("Skip duplicates by 1. ID or 2. content (default: 1): ").strip() == "2" else "id"
+            try:
+                print_io_stats(app.import_todos(path, dedupe=dedupe), "Imported")
+            except (OSError, ValueError, KeyError) as e:
+                print(f"❌ Import failed: {e}")
+        
+        elif choice == "10":
             print("\n👋 Goodbye! Exiting the Todo App...")
             break
         
         else:
-            print("❌ Invalid choice! Please enter a number between 1-8.")
+            print("❌ Invalid choice! Please enter a number between 1-10.")
         
         input("\n⏸️ Press Enter to continue...")
 
+def run_command(args: List[str]) -> int:
+    """Non-interactive bulk commands: export PATH, import PATH [id|hash], benchmark [COUNT]"""
+    command = args[0]
+    if command == "benchmark":
+        for result in benchmark_io(int(args[1]) if len(args) > 1 else 1_000_000):
+            print(f"{result['format']:>7} {result['direction']:<6} {result['records']:>10,} tasks  "
+                  f"{result['records_per_second']:>12,.0f} tasks/s  {result['mb_per_second']:>7.1f} MB/s  "
+                  f"{result['bytes'] / 1e6:>8.1f} MB")
+        return 0
+    if command in ("export", "import") and len(args) >= 2:
+        app = TodoApp(background=False)
+        try:
+            if command == "export":
+                print_io_stats(app.export_todos(args[1]), "Exported")
+            else:
+                print_io_stats(app.import_todos(args[1], dedupe=args[2] if len(args) > 2 else "id"), "Imported")
+        except (OSError, ValueError, KeyError) as e:
+            print(f"❌ {command.title()} failed: {e}")
+            return 1
+        return 0
+    print("Usage: todo_app.py [export PATH | import PATH [id|hash] | benchmark [COUNT]]")
+    return 2
+
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(run_command(sys.argv[1:]))
     try:
         main()
     except KeyboardInterrupt:
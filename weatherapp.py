@@ -1,7 +1,245 @@
 import requests
 import json
-from datetime import datetime
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from operator import mul
+from datetime import datetime, timezone
 import os
+import re
+
+# Column name, array typecode and the factor values are multiplied by before storing
+HISTORY_COLUMNS = (
+    ("ts", "I", 1),           # UTC epoch seconds of the observation
+    ("temp", "h", 100),       # °C
+    ("humidity", "B", 1),     # %
+    ("pressure", "H", 1),     # hPa
+    ("wind", "H", 100),       # m/s
+    ("condition", "H", 1),    # OpenWeatherMap condition id
+)
+MEASURES = ("temp", "humidity", "pressure", "wind")
+# Downsampled store: one row per hour with the count, dominant condition and
+# min/max/mean of every measure (same typecode and scale as the raw column)
+HOURLY_COLUMNS = (("ts", "I", 1), ("count", "H", 1), ("condition", "H", 1)) + tuple(
+    (f"{name}_{stat}", code, scale)
+    for name, code, scale in HISTORY_COLUMNS if name in MEASURES
+    for stat in ("min", "max", "mean")
+)
+STORE_COLUMNS = {"raw": HISTORY_COLUMNS, "hourly": HOURLY_COLUMNS}
+PERIODS = {"hour": 3600, "day": 86400}
+RAW_RETENTION_DAYS = 90  # older readings are downsampled to hourly min/max/mean
+
+def condition_name(code):
+    """Short description for an OpenWeatherMap condition id"""
+    if code == 800:
+        return "Clear"
+    groups = {2: "Thunderstorm", 3: "Drizzle", 5: "Rain", 6: "Snow", 7: "Mist", 8: "Clouds"}
+    return groups.get(code // 100, "Unknown")
+
+class WeatherHistory:
+    """Append-only columnar store of weather readings, one directory per city.
+
+    Each column is a packed binary file (13 bytes per reading in total) so a
+    range query is a binary search on the timestamp column plus array slices.
+    Readings older than RAW_RETENTION_DAYS move to an "hourly" sub-store that
+    keeps count, min, max and mean per hour, so rollups stay exact.
+    """
+    
+    def __init__(self, directory="weather_history"):
+        self.directory = directory
+        self._cache = {}
+    
+    def _city_dir(self, city, kind="raw"):
+        slug = re.sub(r"[^\w-]+", "_", city.strip().lower())
+        path = os.path.join(self.directory, slug)
+        return path if kind == "raw" else os.path.join(path, kind)
+    
+    def cities(self):
+        """Cities that have stored readings"""
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(name.replace("_", " ").title() for name in os.listdir(self.directory))
+    
+    def load(self, city, kind="raw"):
+        """All rows of a city's raw or hourly store as {column: array}, cached until the files change"""
+        city_dir = self._city_dir(city, kind)
+        spec = STORE_COLUMNS[kind]
+        ts_path = os.path.join(city_dir, "ts.col")
+        if not os.path.exists(ts_path):
+            return {name: array(code) for name, code, _ in spec}
+        
+        size = os.path.getsize(ts_path)
+        cached = self._cache.get(city_dir)
+        if cached and cached[0] == size:
+            return cached[1]
+        
+        columns = {}
+        for name, code, _ in spec:
+            column = array(code)
+            path = os.path.join(city_dir, f"{name}.col")
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    column.frombytes(f.read())
+            columns[name] = column
+        # A crash between column writes can leave them uneven; cut every file back to
+        # the complete rows so later appends stay aligned
+        rows = min(len(column) for column in columns.values())
+        for name, column in columns.items():
+            if len(column) > rows:
+                del column[rows:]
+                with open(os.path.join(city_dir, f"{name}.col"), "r+b") as f:
+                    f.truncate(rows * column.itemsize)
+        size = rows * columns["ts"].itemsize
+        self._cache[city_dir] = (size, columns)
+        return columns
+    
+    def _write(self, city, columns, mode, kind="raw"):
+        city_dir = self._city_dir(city, kind)
+        os.makedirs(city_dir, exist_ok=True)
+        spec = STORE_COLUMNS[kind]
+        for name, code, _ in spec:
+            path = os.path.join(city_dir, f"{name}.col")
+            with open(path + ".tmp" if mode == "wb" else path, mode) as f:
+                columns[name].tofile(f)
+        if mode == "wb":
+            for name, _, _ in spec:
+                path = os.path.join(city_dir, f"{name}.col")
+                os.replace(path + ".tmp", path)
+        self._cache.pop(city_dir, None)
+    
+    def record(self, weather_data):
+        """Append a current-weather API response; returns False if it was already stored"""
+        city = weather_data["name"]
+        ts = weather_data["dt"]
+        existing = self.load(city)["ts"]
+        if existing and ts <= existing[-1]:
+            return False
+        hourly = self.load(city, "hourly")["ts"]
+        if hourly and ts < hourly[-1] + 3600:
+            return False
+        
+        values = {
+            "ts": ts,
+            "temp": weather_data["main"]["temp"],
+            "humidity": weather_data["main"]["humidity"],
+            "pressure": weather_data["main"]["pressure"],
+            "wind": weather_data["wind"]["speed"],
+            "condition": weather_data["weather"][0]["id"],
+        }
+        row = {name: array(code, [round(values[name] * scale)]) for name, code, scale in HISTORY_COLUMNS}
+        self._write(city, row, "ab")
+        return True
+    
+    def query(self, city, start, end):
+        """Raw (not yet downsampled) readings with start <= ts < end as dicts (values unscaled)"""
+        columns = self.load(city)
+        lo = bisect_left(columns["ts"], start)
+        hi = bisect_left(columns["ts"], end)
+        names = [(name, scale) for name, _, scale in HISTORY_COLUMNS]
+        return [
+            {name: columns[name][i] / scale if scale != 1 else columns[name][i] for name, scale in names}
+            for i in range(lo, hi)
+        ]
+    
+    def _partials(self, city, start, end, step):
+        """Yield (bucket start, count, {measure: [min, max, sum]}, conditions) in time order.
+
+        Values stay scaled; a bucket can be yielded twice where it spans both stores.
+        """
+        hourly = self.load(city, "hourly")
+        ts = hourly["ts"]
+        i, hi = bisect_left(ts, start), bisect_left(ts, end)
+        while i < hi:
+            bucket = ts[i] - ts[i] % step
+            j = bisect_left(ts, bucket + step, i, hi)
+            counts = hourly["count"][i:j]
+            stats = {
+                name: [min(hourly[f"{name}_min"][i:j]), max(hourly[f"{name}_max"][i:j]),
+                       sum(map(mul, hourly[f"{name}_mean"][i:j], counts))]
+                for name in MEASURES
+            }
+            conditions = Counter()
+            for code, count in zip(hourly["condition"][i:j], counts):
+                conditions[code] += count
+            yield bucket, sum(counts), stats, conditions
+            i = j
+        
+        raw = self.load(city)
+        yield from self._raw_buckets(raw, bisect_left(raw["ts"], start), bisect_left(raw["ts"], end), step)
+    
+    def _raw_buckets(self, raw, lo, hi, step):
+        ts = raw["ts"]
+        i = lo
+        while i < hi:
+            bucket = ts[i] - ts[i] % step
+            j = bisect_left(ts, bucket + step, i, hi)
+            stats = {}
+            for name in MEASURES:
+                values = raw[name][i:j]
+                stats[name] = [min(values), max(values), sum(values)]
+            yield bucket, j - i, stats, Counter(raw["condition"][i:j])
+            i = j
+    
+    def rollup(self, city, start, end, period="day"):
+        """Min/max/mean per hour or day between start and end"""
+        step = PERIODS[period]
+        merged = {}
+        for bucket, count, stats, conditions in self._partials(city, start, end, step):
+            if bucket not in merged:
+                merged[bucket] = [count, stats, conditions]
+                continue
+            entry = merged[bucket]
+            entry[0] += count
+            for name, (low, high, total) in stats.items():
+                current = entry[1][name]
+                current[0], current[1], current[2] = min(current[0], low), max(current[1], high), current[2] + total
+            entry[2].update(conditions)
+        
+        scales = {name: scale for name, _, scale in HISTORY_COLUMNS}
+        buckets = []
+        for bucket, (count, stats, conditions) in merged.items():
+            summary = {"start": bucket, "count": count}
+            for name, (low, high, total) in stats.items():
+                scale = scales[name]
+                summary[name] = {"min": low / scale, "max": high / scale, "mean": total / count / scale}
+            summary["condition"] = conditions.most_common(1)[0][0]
+            buckets.append(summary)
+        return buckets
+    
+    def downsample(self, city, older_than):
+        """Move raw readings from whole hours before older_than into the hourly store; returns rows moved"""
+        cutoff = older_than - older_than % 3600
+        raw = self.load(city)
+        cut = bisect_left(raw["ts"], cutoff)
+        if cut == 0:
+            return 0
+        
+        hourly = {name: array(code) for name, code, _ in HOURLY_COLUMNS}
+        for bucket, count, stats, conditions in self._raw_buckets(raw, 0, cut, 3600):
+            hourly["ts"].append(bucket)
+            hourly["count"].append(min(count, 65535))
+            hourly["condition"].append(conditions.most_common(1)[0][0])
+            for name, (low, high, total) in stats.items():
+                hourly[f"{name}_min"].append(low)
+                hourly[f"{name}_max"].append(high)
+                hourly[f"{name}_mean"].append(round(total / count))
+        self._write(city, hourly, "ab", "hourly")
+        self._write(city, {name: raw[name][cut:] for name in raw}, "wb")
+        return cut
+    
+    def trend(self, city, start, end):
+        """Least-squares slope of hourly mean temperature in °C per day, or None with fewer than 2 hours"""
+        hours = self.rollup(city, start, end, "hour")
+        n = len(hours)
+        if n < 2:
+            return None
+        xs = [(hour["start"] + 1800) / 86400 for hour in hours]
+        ys = [hour["temp"]["mean"] for hour in hours]
+        mean_x, mean_y = sum(xs) / n, sum(ys) / n
+        var_x = sum((x - mean_x) ** 2 for x in xs)
+        if var_x == 0:
+            return None
+        return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / var_x
 
 class WeatherApp:
     def __init__(self):
@@ -11,6 +249,7 @@ class WeatherApp:
         self.forecast_url = "http://api.openweathermap.org/data/2.5/forecast"
         self.favorites_file = "favorite_cities.json"
         self.favorites = self.load_favorites()
+        self.history = WeatherHistory()
     
     def load_favorites(self):
         """Load favorite cities"""
@@ -57,7 +296,9 @@ class WeatherApp:
             
             response = requests.get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
-            return response.json()
+            data = response.json()
+            self.record_reading(data)
+            return data
         
         except requests.exceptions.RequestException as e:
             return {"error": f"API error: {e}"}
@@ -83,6 +324,44 @@ class WeatherApp:
         except Exception as e:
             return {"error": f"Unexpected error: {e}"}
     
+    def record_reading(self, weather_data):
+        """Keep a successful reading in the local history"""
+        if weather_data.get("cod") != 200:
+            return
+        try:
+            if self.history.record(weather_data):
+                cutoff = weather_data["dt"] - RAW_RETENTION_DAYS * 86400
+                self.history.downsample(weather_data["name"], cutoff)
+        except (KeyError, IndexError, TypeError, OverflowError, OSError) as e:
+            print(f"⚠️ Reading not saved to history: {e}")
+    
+    def display_history(self, city, days=7):
+        """Display daily rollups and the temperature trend for a city"""
+        end = int(datetime.now(timezone.utc).timestamp()) + 1
+        start = end - days * 86400
+        daily = self.history.rollup(city, start, end, "day")
+        if not daily:
+            print(f"📭 No stored readings for '{city}' in the last {days} days.")
+            return
+        
+        print("\n" + "="*70)
+        print(f"📈 {city} - HISTORY (last {days} days)")
+        print("="*70)
+        for day in daily:
+            date_str = datetime.fromtimestamp(day["start"], timezone.utc).strftime("%d/%m/%Y - %A")
+            temp = day["temp"]
+            print(f"\n📅 {date_str} ({day['count']} readings)")
+            print(f"🌡️  Min: {temp['min']:.1f}°C | Max: {temp['max']:.1f}°C | Mean: {temp['mean']:.1f}°C")
+            print(f"💧 Humidity: %{day['humidity']['mean']:.0f} | 📊 Pressure: {day['pressure']['mean']:.0f} hPa "
+                  f"| 🌪️  Wind: {day['wind']['mean']:.1f} m/s")
+            print(f"🌤️  Mostly: {condition_name(day['condition'])}")
+            print("-" * 50)
+        
+        slope = self.history.trend(city, start, end)
+        if slope is not None:
+            arrow = "📈" if slope > 0.1 else "📉" if slope < -0.1 else "➡️"
+            print(f"{arrow} Temperature trend: {slope:+.2f}°C per day")
+    
     def display_current_weather(self, weather_data):
         """Display the current weather data"""
         if "error" in weather_data:
@@ -227,10 +506,11 @@ class WeatherApp:
             print("3. Add to Favorites")
             print("4. Remove from Favorites")
             print("5. View Favorites")
-            print("6. Exit")
+            print("6. View History & Trends")
+            print("7. Exit")
             print("="*40)
             
-            choice = input("👉 Enter your choice (1-6): ").strip()
+            choice = input("👉 Enter your choice (1-7): ").strip()
             
             if choice == "1":
                 city_name = input("Enter a city name: ").strip().title()
@@ -271,11 +551,20 @@ class WeatherApp:
                         print("❌ Invalid choice. Please enter a number or 'B'.")
             
             elif choice == "6":
+                stored = self.history.cities()
+                if stored:
+                    print(f"🗂️  Cities with history: {', '.join(stored)}")
+                city_name = input("Enter a city name: ").strip().title()
+                if city_name:
+                    days = input("Number of days (default: 7): ").strip()
+                    self.display_history(city_name, int(days) if days.isdigit() and int(days) > 0 else 7)
+            
+            elif choice == "7":
                 print("👋 Thank you for using the Weather App. Goodbye!")
                 break
                 
             else:
-                print("❌ Invalid choice. Please enter a number from 1 to 6.")
+                print("❌ Invalid choice. Please enter a number from 1 to 7.")
 
 if __name__ == "__main__":
     app = WeatherApp()